@@ -10,7 +10,13 @@ if TYPE_CHECKING:
 
 
 class QosPolicy(BaseModel):
-    """SLURM Quality of Service policy defining job limits."""
+    """SLURM Quality of Service policy defining job limits.
+
+    Policies are immutable so that a single instance can be shared between
+    resources.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str
     max_walltime: Optional[int] = None  # in minutes
@@ -27,6 +33,13 @@ class Resource(BaseModel):
     memory_per_node: int
     qos: List[QosPolicy] = Field(default_factory=list)
     _existing_jobs: Dict[str, List[Tuple[str, int, int]]] = PrivateAttr(default_factory=dict)
+    # Running total of cores per QoS policy, kept in sync by _add_job
+    _cores_in_use: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def _add_job(self, qos_name: str, job: Tuple[str, int, int]) -> None:
+        """Record a (job_id, walltime, cores) job under a QoS policy and update its core usage."""
+        self._existing_jobs.setdefault(qos_name, []).append(job)
+        self._cores_in_use[qos_name] = self._cores_in_use.get(qos_name, 0) + job[2]
 
     def fits_in_qos(self, walltime: int, cores: int) -> QosPolicy | None:
         """
@@ -41,25 +54,19 @@ class Resource(BaseModel):
         """
 
         # What happens when the job does not fit in the best possible QoS?
-        for policy in self.qos:
-            existing_jobs = self._existing_jobs.get(policy.name, [])
-
-            # Check walltime constraint (None means unlimited)
-            if policy.max_walltime is not None and policy.max_walltime < walltime:
-                continue
-
-            # Check cores constraint (None means unlimited)
-            if policy.max_cores is not None:
-                remaining_cores = policy.max_cores - sum(job[2] for job in existing_jobs)
-                if remaining_cores < cores:
-                    continue
-
-            # Check max jobs constraint (None means unlimited)
-            if policy.max_jobs is not None and len(existing_jobs) >= policy.max_jobs:
-                continue
-
-            return policy
-        return None
+        # A None limit means the constraint is unlimited.
+        cores_in_use = self._cores_in_use
+        existing_jobs = self._existing_jobs
+        return next(
+            (
+                policy
+                for policy in self.qos
+                if (policy.max_walltime is None or policy.max_walltime >= walltime)
+                and (policy.max_cores is None or policy.max_cores - cores_in_use.get(policy.name, 0) >= cores)
+                and (policy.max_jobs is None or len(existing_jobs.get(policy.name, ())) < policy.max_jobs)
+            ),
+            None,
+        )
 
     def register_job(self, job_id: str, walltime: int, cores: int) -> bool:
         """
@@ -75,13 +82,27 @@ class Resource(BaseModel):
         """
         qos_policy = self.fits_in_qos(walltime, cores)
         if qos_policy:
-            qos_name = qos_policy.name
-            existing_jobs = self._existing_jobs.get(qos_name, [])
-            existing_jobs.append((job_id, walltime, cores))
-            self._existing_jobs[qos_name] = existing_jobs
+            self._add_job(qos_policy.name, (job_id, walltime, cores))
             return True
         return False
 
+    def register_jobs(self, jobs: List[Tuple[str, int, int]]) -> List[bool]:
+        """
+        Register several jobs at once using First-Fit-Decreasing.
+
+        Jobs are placed longest walltime first, then largest core count first.
+
+        Args:
+            jobs (List[Tuple[str, int, int]]): (job_id, walltime, cores) tuples.
+
+        Returns:
+            List[bool]: Whether each job was registered, in the order of ``jobs``.
+        """
+        registered = [False] * len(jobs)
+        for idx in sorted(range(len(jobs)), key=lambda idx: (-jobs[idx][1], -jobs[idx][2])):
+            registered[idx] = self.register_job(*jobs[idx])
+        return registered
+
 class ResourceSpec(BaseModel):
     ranks: int = 1
     threads: int = 1
@@ -1,7 +1,7 @@
+import tomllib
 from argparse import ArgumentParser, Namespace
 
 import humanfriendly
-import toml
 
 from socm.core.models import DAG, Campaign
 from socm.utils.misc import get_workflow_entries, parse_comma_separated_fields
@@ -51,7 +51,8 @@ def _main(args: Namespace) -> None:
     # Import here to avoid loading radical.pilot at CLI startup (not available on macOS)
     from socm.bookkeeper import Bookkeeper
 
-    config = toml.load(args.toml)
+    with open(args.toml, "rb") as toml_file:
+        config = tomllib.load(toml_file)
     config = parse_comma_separated_fields(config=config, fields_to_parse=["maxiter", "downsample"])
     workflows_configs = get_workflow_entries(config, subcampaign_map=subcampaign_map)
 
@@ -7,6 +7,9 @@ import yaml
 from socm.core.models import DAG, Campaign
 from socm.workflows import SpectraWorkflow
 
+# Use the libyaml C parser when PyYAML was built against it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_parser(parser: ArgumentParser) -> ArgumentParser:
     """
@@ -52,7 +55,7 @@ def _main(args: Namespace) -> None:
     from socm.bookkeeper import Bookkeeper
 
     with open(args.yaml) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     campaign_dag = DAG()
     last_workflow_id = 1
@@ -1,3 +1,4 @@
+import heapq
 from typing import Dict, List, Tuple
 
 import networkx as nx
@@ -6,6 +7,124 @@ import numpy as np
 from ..core import DAG, Campaign, QosPolicy, Resource
 from .base import PlanEntry, Planner
 
+# The slot search kernels below are compiled with numba when the optional
+# 'performance' extra is installed. Compilation happens on the first plan in
+# each process (a few seconds); cache=True then stores the compiled kernels in
+# __pycache__ next to this module, or in a per-user cache directory when that
+# is read-only. Set NUMBA_CACHE_DIR to choose the location explicitly.
+# Without numba the scalar kernels would run as plain Python loops, so the
+# slot search uses a vectorised NumPy version instead.
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Fallback that leaves the decorated function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Resource requirements of the workflows in one dependency level
+_REQUIREMENTS_DTYPE = np.dtype(
+    [("estimated_walltime", "f8"), ("estimated_cpus", "i8"), ("estimated_memory", "f8")]
+)
+
+
+@njit(cache=True, boundscheck=False)
+def _free_memory(
+    plan_start: np.ndarray,
+    plan_end: np.ndarray,
+    plan_memory: np.ndarray,
+    total_memory: float,
+    start_time: float,
+) -> float:
+    """Memory still available at ``start_time`` given the workflows in the plan."""
+    used_memory = 0.0
+    for row in range(plan_start.shape[0]):
+        if plan_start[row] <= start_time and start_time < plan_end[row]:
+            used_memory += plan_memory[row]
+    return total_memory - used_memory
+
+
+@njit(cache=True, boundscheck=False)
+def _slot_finish_time(
+    resource_free: np.ndarray,
+    core_idx: int,
+    cpus: int,
+    plan_start: np.ndarray,
+    plan_end: np.ndarray,
+    plan_memory: np.ndarray,
+    total_memory: float,
+    walltime: float,
+    memory: float,
+    earlier_start: float,
+) -> float:
+    """Finish time of a workflow placed on cores ``[core_idx, core_idx + cpus)``.
+
+    Returns infinity when the memory left at the slot's start time, given the
+    workflows already in the plan, does not cover ``memory``.
+    """
+    start_time = max(float(resource_free[core_idx:core_idx + cpus].max()), earlier_start)
+    if _free_memory(plan_start, plan_end, plan_memory, total_memory, start_time) < memory:
+        return np.inf
+    return start_time + walltime
+
+
+@njit(cache=True, boundscheck=False)
+def _slot_finish_times(
+    resource_free: np.ndarray,
+    plan_start: np.ndarray,
+    plan_end: np.ndarray,
+    plan_memory: np.ndarray,
+    total_memory: float,
+    walltime: float,
+    cpus: int,
+    memory: float,
+    earlier_start: float,
+) -> np.ndarray:
+    """Insertion-based earliest finish time of every contiguous core slot.
+
+    Cores are split in consecutive blocks of ``cpus``; block ``i`` starts at
+    core ``i * cpus``.
+    """
+    num_slots = resource_free.shape[0] // cpus
+    finish_times = np.empty(num_slots)
+    for slot in range(num_slots):
+        finish_times[slot] = _slot_finish_time(
+            resource_free, slot * cpus, cpus, plan_start, plan_end, plan_memory,
+            total_memory, walltime, memory, earlier_start
+        )
+    return finish_times
+
+
+def _slot_finish_times_numpy(
+    resource_free: np.ndarray,
+    plan_start: np.ndarray,
+    plan_end: np.ndarray,
+    plan_memory: np.ndarray,
+    total_memory: float,
+    walltime: float,
+    cpus: int,
+    memory: float,
+    earlier_start: float,
+) -> np.ndarray:
+    """Vectorised :func:`_slot_finish_times`, used when numba is not installed."""
+    num_slots = resource_free.shape[0] // cpus
+    slot_free = resource_free[:num_slots * cpus].reshape(num_slots, cpus).max(axis=1)
+    start_times = np.maximum(slot_free, earlier_start).astype(float)
+
+    # Slots often share a start time, so the memory check runs once per distinct start
+    unique_starts, inverse = np.unique(start_times, return_inverse=True)
+    running = (plan_start <= unique_starts[:, None]) & (unique_starts[:, None] < plan_end)
+    free_memory = total_memory - np.where(running, plan_memory, 0.0).sum(axis=1)
+
+    return np.where(free_memory[inverse] < memory, np.inf, start_times + walltime)
+
+
+_find_slot_finish_times = _slot_finish_times if _HAS_NUMBA else _slot_finish_times_numpy
+
 
 class HeftPlanner(Planner):
     """Campaign planner using Heterogeneous Earliest Finish Time (HEFT) algorithm.
@@ -19,9 +138,9 @@ class HeftPlanner(Planner):
         IEEE Transactions on Parallel and Distributed Systems, 13(3), 260-274.
 
     Attributes:
-        _estimated_walltime: List of estimated execution times (walltime) for each workflow
-        _estimated_cpus: List of estimated CPU requirements for each workflow
-        _estimated_memory: List of estimated memory requirements for each workflow
+        _plan_start: Start time of each workflow in ``_plan``, in scheduling order
+        _plan_end: End time of each workflow in ``_plan``, in scheduling order
+        _plan_memory: Memory of each workflow in ``_plan``, in scheduling order
     """
 
     def __init__(
@@ -41,28 +160,28 @@ class HeftPlanner(Planner):
             policy=policy,
             objective=objective
         )
-        # Initialize estimation tables (populated during planning)
-        self._estimated_walltime: List[float] = []
-        self._estimated_cpus: List[int] = []
-        self._estimated_memory: List[float] = []
+        self._reset_plan()
 
-    def _get_free_memory(self, start_time: float, num_nodes: float) -> float:
-        """Calculate available memory at a given time.
-
-        Args:
-            start_time: Time point to check memory availability
-            num_nodes: The total number of nodes used
-
-        Returns:
-            Available memory in MB
-        """
-        total_memory = num_nodes * self._resources.memory_per_node
-        used_memory = sum(
-            entry.memory
-            for entry in self._plan
-            if entry.start_time <= start_time < entry.end_time
-        )
-        return total_memory - used_memory
+    def _reset_plan(self, size: int = 0) -> None:
+        """Clear the plan and preallocate its time and memory columns with ``size`` rows."""
+        self._plan: List[PlanEntry] = []
+        self._plan_start = np.zeros(size)
+        self._plan_end = np.zeros(size)
+        self._plan_memory = np.zeros(size)
+
+    def _append_plan_entry(self, entry: PlanEntry) -> None:
+        """Record a scheduled workflow in the plan and its time and memory columns."""
+        row = len(self._plan)
+        if row == len(self._plan_start):
+            capacity = max(1, 2 * row)
+            self._plan_start = np.concatenate((self._plan_start, np.zeros(capacity - row)))
+            self._plan_end = np.concatenate((self._plan_end, np.zeros(capacity - row)))
+            self._plan_memory = np.concatenate((self._plan_memory, np.zeros(capacity - row)))
+
+        self._plan_start[row] = entry.start_time
+        self._plan_end[row] = entry.end_time
+        self._plan_memory[row] = entry.memory
+        self._plan.append(entry)
 
     def _get_max_ncores(self, resource_requirements: Dict[int, Dict[str, float]]) -> int:
         """Get the maximum number of cores required by any single workflow."""
@@ -166,20 +285,24 @@ class HeftPlanner(Planner):
         self._logger.debug("Create resource dependency DAG")
         graph = nx.DiGraph()
 
-        # Track which workflow is using each core
-        core_dependencies = {i: None for i in range(len(resources))}
+        # Cores of each scheduled workflow as a bitmask, in scheduling order
+        core_masks: List[Tuple[int | None, int]] = []
 
         for entry in plan:
-            # Find all previous tasks that occupied these cores
-            previous_tasks = {
-                core_dependencies[core]
-                for core in entry.cores
-                if core_dependencies[core] is not None
-            }
+            mask = ((1 << len(entry.cores)) - 1) << (entry.cores.start - resources.start)
 
-            # Update core ownership
-            for core in entry.cores:
-                core_dependencies[core] = entry.workflow.id
+            # Walking back through the schedule, the first workflow holding a
+            # core was the last one assigned to it; stop once all cores are claimed
+            previous_tasks = set()
+            unclaimed = mask
+            for workflow_id, previous_mask in reversed(core_masks):
+                if not unclaimed:
+                    break
+                if previous_mask & unclaimed:
+                    previous_tasks.add(workflow_id)
+                    unclaimed &= ~previous_mask
+
+            core_masks.append((entry.workflow.id, mask))
 
             # Add node and edges to graph
             if not previous_tasks:
@@ -244,33 +367,31 @@ class HeftPlanner(Planner):
         return plan, plan_graph, None, requested_resources
 
     def _initialize_resource_estimates(self, resource_requirements: Dict[int, Dict[str, float]], widxs: List[int]
-    ) -> Dict[str, List[float]]:
-        """Extract and store resource requirement estimates from workflows."""
-        estimated_walltime = []
-        estimated_cpus = []
-        estimated_memory = []
-
-        for widx in widxs:
-            estimated_walltime.append(resource_requirements[widx]["req_walltime"])
-            estimated_cpus.append(resource_requirements[widx]["req_cpus"])
-            estimated_memory.append(resource_requirements[widx]["req_memory"])
-        return {"estimated_walltime" : estimated_walltime,
-                "estimated_cpus" : estimated_cpus,
-                "estimated_memory" : estimated_memory}
-
-    def _get_sorted_workflow_indices(self, estimated_walltime: List[float]) -> List[int]:
-        """Get workflow indices sorted by execution time (longest first).
+    ) -> np.ndarray:
+        """Extract resource requirement estimates into a structured array.
+
+        Row ``i`` holds the estimates of workflow ``widxs[i]``, so the
+        scheduling loop reads fixed-offset columns instead of nested dicts.
+        """
+        requirements = np.zeros(len(widxs), dtype=_REQUIREMENTS_DTYPE)
+        for row, widx in enumerate(widxs):
+            values = resource_requirements[widx]
+            requirements[row] = (values["req_walltime"], values["req_cpus"], values["req_memory"])
+        return requirements
+
+    def _build_ready_queue(self, estimated_walltime: np.ndarray) -> List[Tuple[float, int]]:
+        """Build a priority queue of ready workflows, longest execution time first.
+
+        Entries are ``(-walltime, workflow_index)`` tuples kept as a heap, so
+        ``heapq.heappop`` returns the longest workflow next and breaks ties by
+        the lowest index.
 
         Returns:
-            List of workflow indices in descending order of execution time
+            Heap of (negated walltime, workflow index) tuples
         """
-        return [
-            idx for idx, _ in sorted(
-                enumerate(estimated_walltime),
-                key=lambda x: x[1],
-                reverse=True
-            )
-        ]
+        ready_queue = [(-float(walltime), idx) for idx, walltime in enumerate(estimated_walltime)]
+        heapq.heapify(ready_queue)
+        return ready_queue
 
     def _initialize_resource_free_times(
         self, resources: range, start_time: float | int | list | np.ndarray
@@ -294,7 +415,7 @@ class HeftPlanner(Planner):
     def _find_best_resource_slot(
         self,
         workflow_idx: int,
-        resource_requirements: Dict[str, List[float]],
+        resource_requirements: np.ndarray,
         resources: range,
         resource_free: np.ndarray,
         earlier_start: float
@@ -303,7 +424,7 @@ class HeftPlanner(Planner):
 
         Args:
             workflow_idx: Index of the workflow to schedule
-            resource_requirements: Dict of estimated resource lists
+            resource_requirements: Structured array of estimated resources
             resources: Available resource cores
             resource_free: Array tracking when each core becomes available
             earlier_start: Earliest allowed start time (from dependency constraints)
@@ -315,33 +436,29 @@ class HeftPlanner(Planner):
         memory_required = resource_requirements["estimated_memory"][workflow_idx]
         cpus_required = resource_requirements["estimated_cpus"][workflow_idx]
 
-        min_end_time = float("inf")
-        best_core_idx = 0
-        core_idx = 0
-
-        while (core_idx + cpus_required) <= len(resources):
-            core_slice = slice(core_idx, core_idx + cpus_required)
-            start_time_candidate = max(resource_free[core_slice].max(), earlier_start)
-            end_time_candidate = start_time_candidate + walltime
-
-            free_memory = self._get_free_memory(start_time_candidate, len(resources) / self._resources.cores_per_node)
-
-            if free_memory >= memory_required:
-                self._logger.debug(
-                    f"Workflow {workflow_idx}: candidate finish time {end_time_candidate}"
-                )
-                if end_time_candidate < min_end_time:
-                    min_end_time = end_time_candidate
-                    best_core_idx = core_idx
-                self._logger.debug(
-                    f"Workflow {workflow_idx}: minimum finish time {min_end_time}"
-                )
-            else:
-                self._logger.debug(
-                    f"Insufficient memory: {free_memory} MB available, {memory_required} MB required"
-                )
-
-            core_idx += cpus_required
+        rows = len(self._plan)
+        total_memory = len(resources) / self._resources.cores_per_node * self._resources.memory_per_node
+
+        finish_times = _find_slot_finish_times(
+            resource_free,
+            self._plan_start[:rows],
+            self._plan_end[:rows],
+            self._plan_memory[:rows],
+            float(total_memory),
+            float(walltime),
+            int(cpus_required),
+            float(memory_required),
+            float(earlier_start),
+        )
+        if len(finish_times) == 0:
+            best_core_idx, min_end_time = 0, float("inf")
+        else:
+            # argmin keeps the lowest slot on ties, like a sequential scan would
+            best_slot = int(finish_times.argmin())
+            best_core_idx, min_end_time = best_slot * int(cpus_required), float(finish_times[best_slot])
+        self._logger.debug(
+            f"Workflow {workflow_idx}: minimum finish time {min_end_time} on core {best_core_idx}"
+        )
 
         return best_core_idx, min_end_time - walltime
 
@@ -374,33 +491,34 @@ class HeftPlanner(Planner):
         )
         resource_requirements = resource_requirements if resource_requirements else self._resource_requirements
         # Reset plan for fresh scheduling
-        self._plan: List[PlanEntry] = []
+        self._reset_plan(size=sum(len(workflows) for workflows in workflow_levels))
 
         # Track when each core becomes available
         resource_free = self._initialize_resource_free_times(cores, start_time)
+        # Finish time of every scheduled workflow, keyed by name for dependency lookups
+        end_times: Dict[str, float] = {}
 
         for workflows in workflow_levels:
             requirements = self._initialize_resource_estimates(resource_requirements=resource_requirements,
                                                 widxs=[w.id for w in workflows])
 
-            # Sort workflows by execution time (longest first)
-            sorted_indices = self._get_sorted_workflow_indices(estimated_walltime=requirements["estimated_walltime"])
+            # Queue workflows by execution time (longest first)
+            ready_queue = self._build_ready_queue(estimated_walltime=requirements["estimated_walltime"])
 
             # Schedule each workflow
-            for workflow_idx in sorted_indices:
+            while ready_queue:
+                _, workflow_idx = heapq.heappop(ready_queue)
                 workflow = workflows[workflow_idx]
-                earliest_start = 0
-                if workflow.depends:
-                    for entry in self._plan:
-                        if entry.workflow.name in workflow.depends:
-                            earliest_start = max(earliest_start, entry.end_time)
+                earliest_start = max(
+                    (end_times[name] for name in workflow.depends if name in end_times), default=0
+                )
                 best_core_idx, start_time_actual = self._find_best_resource_slot(
                     workflow_idx, requirements, cores, resource_free, earlier_start=earliest_start
                 )
 
-                walltime = requirements["estimated_walltime"][workflow_idx]
-                memory_required = requirements["estimated_memory"][workflow_idx]
-                cpus_required = requirements["estimated_cpus"][workflow_idx]
+                walltime = float(requirements["estimated_walltime"][workflow_idx])
+                memory_required = float(requirements["estimated_memory"][workflow_idx])
+                cpus_required = int(requirements["estimated_cpus"][workflow_idx])
                 core_slice = slice(best_core_idx, best_core_idx + cpus_required)
 
                 # Create plan entry
@@ -411,7 +529,8 @@ class HeftPlanner(Planner):
                     start_time=start_time_actual,
                     end_time=start_time_actual + walltime
                 )
-                self._plan.append(plan_entry)
+                self._append_plan_entry(plan_entry)
+                end_times[workflow.name] = plan_entry.end_time
 
                 # Update resource availability
                 resource_free[core_slice] = start_time_actual + walltime
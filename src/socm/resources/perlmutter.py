@@ -1,5 +1,19 @@
 from ..core import QosPolicy, Resource
 
+PERLMUTTER_QOS_REGULAR = QosPolicy.model_construct(name="regular", max_walltime=2880, max_jobs=5000, max_cores=393216)
+PERLMUTTER_QOS_INTERACTIVE = QosPolicy.model_construct(name="interactive", max_walltime=240, max_jobs=2, max_cores=512)
+PERLMUTTER_QOS_SHARED_INTERACTIVE = QosPolicy.model_construct(
+    name="shared_interactive", max_walltime=240, max_jobs=2, max_cores=64
+)
+PERLMUTTER_QOS_DEBUG = QosPolicy.model_construct(name="debug", max_walltime=30, max_jobs=5, max_cores=1024)
+
+_DEFAULT_PERLMUTTER_QOS = (
+    PERLMUTTER_QOS_REGULAR,
+    PERLMUTTER_QOS_INTERACTIVE,
+    PERLMUTTER_QOS_SHARED_INTERACTIVE,
+    PERLMUTTER_QOS_DEBUG,
+)
+
 
 class PerlmutterResource(Resource):
     """
@@ -15,8 +29,5 @@ class PerlmutterResource(Resource):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self.qos = [QosPolicy(name="regular", max_walltime=2880, max_jobs=5000, max_cores=393216),
-                    QosPolicy(name="interactive", max_walltime=240, max_jobs=2, max_cores=512),
-                    QosPolicy(name="shared_interactive", max_walltime=240, max_jobs=2, max_cores=64),
-                    QosPolicy(name="debug", max_walltime=30, max_jobs=5, max_cores=1024)
-                    ]
+        if "qos" not in data:
+            self.qos = list(_DEFAULT_PERLMUTTER_QOS)
@@ -1,5 +1,21 @@
 from ..core import QosPolicy, Resource
 
+TIGER_QOS_TEST = QosPolicy.model_construct(name="test", max_walltime=60, max_jobs=1, max_cores=8000)
+TIGER_QOS_VSHORT = QosPolicy.model_construct(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104)
+TIGER_QOS_SHORT = QosPolicy.model_construct(name="short", max_walltime=1440, max_jobs=50, max_cores=8000)
+TIGER_QOS_MEDIUM = QosPolicy.model_construct(name="medium", max_walltime=4320, max_jobs=80, max_cores=4000)
+TIGER_QOS_LONG = QosPolicy.model_construct(name="long", max_walltime=8640, max_jobs=16, max_cores=1000)
+TIGER_QOS_VLONG = QosPolicy.model_construct(name="vlong", max_walltime=21600, max_jobs=8, max_cores=900)
+
+_DEFAULT_TIGER_QOS = (
+    TIGER_QOS_TEST,
+    TIGER_QOS_VSHORT,
+    TIGER_QOS_SHORT,
+    TIGER_QOS_MEDIUM,
+    TIGER_QOS_LONG,
+    TIGER_QOS_VLONG,
+)
+
 
 class TigerResource(Resource):
     """
@@ -15,10 +31,5 @@ class TigerResource(Resource):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self.qos = [QosPolicy(name="test", max_walltime=60, max_jobs=1, max_cores=8000),
-                    QosPolicy(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104),
-                    QosPolicy(name="short", max_walltime=1440, max_jobs=50, max_cores=8000),
-                    QosPolicy(name="medium", max_walltime=4320, max_jobs=80, max_cores=4000),
-                    QosPolicy(name="long", max_walltime=8640, max_jobs=16, max_cores=1000),
-                    QosPolicy(name="vlong", max_walltime=21600, max_jobs=8, max_cores=900)
-                    ]
+        if "qos" not in data:
+            self.qos = list(_DEFAULT_TIGER_QOS)
@@ -1,5 +1,9 @@
 from ..core import QosPolicy, Resource
 
+UNIVERSE_QOS_MAIN = QosPolicy.model_construct(name="main", max_walltime=43200, max_jobs=5000, max_cores=6272)
+
+_DEFAULT_UNIVERSE_QOS = (UNIVERSE_QOS_MAIN,)
+
 
 class UniverseResource(Resource):
     """
@@ -15,4 +19,5 @@ class UniverseResource(Resource):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self.qos = [QosPolicy(name="main", max_walltime=43200, max_jobs=5000, max_cores=6272)]
+        if "qos" not in data:
+            self.qos = list(_DEFAULT_UNIVERSE_QOS)
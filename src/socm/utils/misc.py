@@ -1,4 +1,5 @@
 import ast
+from collections.abc import Mapping, Sequence
 from typing import Dict, List
 
 import networkx as nx
@@ -13,7 +14,10 @@ def parse_comma_separated_fields(config: dict, fields_to_parse: List[str]) -> di
             config[key] = [ast.literal_eval(item.strip()) for item in value.split(',')]
     return config
 
-def get_workflow_entries(campaign_dict: dict, subcampaign_map: Dict[str, list] | None = None) -> Dict[str, dict]:
+def get_workflow_entries(
+    campaign_dict: dict,
+    subcampaign_map: Mapping[str, Sequence[str]] | None = None,
+) -> Dict[str, dict]:
     """
     Extract workflow entries from a campaign dictionary using a predefined mapping.
 
@@ -21,9 +25,9 @@ def get_workflow_entries(campaign_dict: dict, subcampaign_map: Dict[str, list] |
     ----------
     campaign_dict : dict
         A dictionary containing campaign configuration.
-    subcampaign_map : dict or None, optional
-        A mapping of subcampaign names to lists of their workflow names.
-        E.g., {"ml-null-test": ["mission-tests", "wafer-tests"]}.
+    subcampaign_map : Mapping or None, optional
+        A mapping of subcampaign names to lists or tuples of their workflow names.
+        E.g., {"ml-null-test": ("mission-tests", "wafer-tests")}.
 
     Returns
     -------
@@ -45,10 +49,10 @@ def get_workflow_entries(campaign_dict: dict, subcampaign_map: Dict[str, list] |
             continue
 
         # Check if this is a known subcampaign
-        if workflow_key in subcampaign_map:
+        subcampaign_workflows = subcampaign_map.get(workflow_key)
+        if subcampaign_workflows is not None:
             # Process known workflows for this subcampaign
             subcampaign_name = workflow_key
-            subcampaign_workflows = subcampaign_map[workflow_key]
 
             # Create a copy of the subcampaign config without its workflows
             subcampaign_common_config = {
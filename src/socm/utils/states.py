@@ -14,4 +14,4 @@ class States(Enum):
     CANCELED = auto()  # Campaign got canceled by the user.
 
 # Final states for a campaign
-CFINAL = [States.DONE, States.FAILED, States.CANCELED]
+CFINAL = frozenset((States.DONE, States.FAILED, States.CANCELED))
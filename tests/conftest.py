@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -38,6 +39,20 @@ if "slurmise" not in sys.modules:
     sys.modules["slurmise.slurm"] = _slurmise.slurm
 
 
+# Read-only metadata shared by every mocked Context.get_meta call
+_META = SimpleNamespace(samps=SimpleNamespace(count=1000))
+
+# Observations returned by the mocked mapmaking obsdb; workflows only read them
+_MAPMAKING_OBSERVATIONS = ({"obs_id": "1575600533.1575611468.ar5_1", "n_samples": 259584},)
+
+
+def _read_only(config: dict) -> MappingProxyType:
+    """Wrap a session-wide config and every mapping nested in it in read-only views."""
+    return MappingProxyType(
+        {key: _read_only(value) if isinstance(value, dict) else value for key, value in config.items()}
+    )
+
+
 @pytest.fixture
 def mock_filemd5():
     """Create a fixture that returns a mock Context class."""
@@ -133,23 +148,24 @@ def mock_context():
         class MockContextImpl:
             def __init__(self, context_file):
                 self.obsdb = mock.Mock()
-                self.obsdb.query = mock.Mock(
-                    return_value=[
-                        {"obs_id": "1575600533.1575611468.ar5_1", "n_samples": 259584}
-                    ]
-                )
+                self.obsdb.query = mock.Mock(return_value=_MAPMAKING_OBSERVATIONS)
 
             def get_meta(self, obs_id):
-                return mock.Mock(samps=mock.Mock(count=1000))
+                return _META
 
         # Set the side effect to use our implementation
         mocked.side_effect = MockContextImpl
         yield mocked
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_config():
-    """Return a dictionary with test configuration instead of a TOML file path."""
+    """
+    Return a read-only mapping with test configuration instead of a TOML file path.
+
+    Shared by the whole session; tests that need a variant must build an
+    overlay instead.
+    """
     config = {
         "campaign": {
             "deadline": "2d",
@@ -207,13 +223,15 @@ def simple_config():
             },
         }
     }
-    return config
+    return _read_only(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lite_config():
     """
     A lightweight configuration for testing ML mapmaking workflows.
+
+    Shared by the whole session and read-only.
     """
     config = {
         "campaign": {
@@ -242,11 +260,18 @@ def lite_config():
         }
     }
 
-    return config
+    return _read_only(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_config():
+    """
+    Campaign configuration shared by the whole session.
+
+    The top level and the campaign table are read-only. get_workflow_entries
+    only descends into plain dicts, so the workflow tables below stay dicts;
+    tests must not mutate them.
+    """
     config = {
         "campaign": {
             "deadline": "2d",
@@ -327,4 +352,4 @@ def campaign_config():
             },
         },
     }
-    return config
+    return MappingProxyType({**config, "campaign": MappingProxyType(config["campaign"])})
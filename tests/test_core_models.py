@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
 
 # Mock pydantic BaseModel for testing
@@ -30,6 +31,10 @@ def test_qos_creation():
     assert qos.max_jobs == 5
     assert qos.max_cores == 5
 
+    # Policies are shared between resources, so they must be immutable
+    with pytest.raises(ValidationError):
+        qos.max_cores = 10
+
 @patch('socm.core.models.BaseModel', MockBaseModel)
 def test_resource_creation():
     """Test Resource model creation."""
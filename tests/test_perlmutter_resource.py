@@ -1,5 +1,5 @@
 from socm.core.models import QosPolicy
-from socm.resources.perlmutter import PerlmutterResource
+from socm.resources.perlmutter import PERLMUTTER_QOS_INTERACTIVE, PERLMUTTER_QOS_REGULAR, PerlmutterResource
 
 
 def test_perlmutter_resource_init():
@@ -101,27 +101,27 @@ def test_fits_in_qos_with_existing_jobs():
     """Test that fits_in_qos accounts for cores used by existing jobs."""
     resource = PerlmutterResource()
     # Fill regular QoS almost completely
-    resource._existing_jobs = {"regular": [("job1", 100, 392716)]}
+    resource._add_job("regular", ("job1", 100, 392716))
 
     # Job should still fit in regular since 392716 + 400 < 393216
     qos = resource.fits_in_qos(walltime=20, cores=400)
-    assert qos == QosPolicy(name='regular', max_walltime=2880, max_jobs=5000, max_cores=393216)
+    assert qos is PERLMUTTER_QOS_REGULAR
 
     # Now try with 501 cores (392716 + 501 = 393217 > 393216, exceeds regular limit)
     # Should fall back to interactive (which has 512 cores max)
     qos = resource.fits_in_qos(walltime=20, cores=501)
-    assert qos == QosPolicy(name="interactive", max_walltime=240, max_jobs=2, max_cores=512)
+    assert qos is PERLMUTTER_QOS_INTERACTIVE
 
 
 def test_fits_in_qos_no_remaining_cores():
     """Test when all cores in a QoS are consumed."""
     resource = PerlmutterResource()
 
-    resource._existing_jobs = {"debug": [("job1", 20, 1024)]}
+    resource._add_job("debug", ("job1", 20, 1024))
 
     # Try to fit another job
     qos = resource.fits_in_qos(walltime=20, cores=100)
-    assert qos == QosPolicy(name="regular", max_walltime=2880, max_jobs=5000, max_cores=393216)
+    assert qos is PERLMUTTER_QOS_REGULAR
 
 
 def test_register_job_success():
@@ -209,7 +209,7 @@ def test_register_job_integration():
     # Check if job fits
     qos_before = resource.fits_in_qos(walltime=20, cores=1024)
     assert qos_before is not None
-    assert qos_before == QosPolicy(name="regular", max_walltime=2880, max_jobs=5000, max_cores=393216)
+    assert qos_before is PERLMUTTER_QOS_REGULAR
 
     # Register the job
     result = resource.register_job("large_job", walltime=20, cores=1024)
@@ -218,4 +218,4 @@ def test_register_job_integration():
     # Verify job was registered in regular QoS
     qos_after = resource.fits_in_qos(walltime=20, cores=100)
     assert qos_after is not None
-    assert qos_after == QosPolicy(name="regular", max_walltime=2880, max_jobs=5000, max_cores=393216)
+    assert qos_after is PERLMUTTER_QOS_REGULAR
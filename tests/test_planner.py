@@ -1,3 +1,4 @@
+import heapq
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -6,7 +7,8 @@ import numpy as np
 import pytest
 
 from socm.core import DAG, Campaign, QosPolicy, Resource, ResourceSpec, Workflow
-from socm.planner import HeftPlanner, PlanEntry
+from socm.planner import HeftPlanner, PlanEntry, heft_planner
+from socm.planner.heft_planner import _free_memory, _slot_finish_times, _slot_finish_times_numpy
 from socm.resources import TigerResource
 
 
@@ -17,10 +19,19 @@ def compare_entries(expected_entry: PlanEntry, test_entry: PlanEntry) -> None:
     assert np.isclose(expected_entry.start_time, test_entry.start_time)
     assert np.isclose(expected_entry.end_time, test_entry.end_time)
 
+
+# Slot search implementations: the numba kernel (plain Python when numba is
+# missing) and the vectorised NumPy fallback used without numba
+SLOT_FINISH_TIMES = pytest.mark.parametrize(
+    "slot_finish_times", [_slot_finish_times, _slot_finish_times_numpy], ids=["kernel", "numpy"]
+)
+
 # ------------------------------------------------------------------------------
 #
+@SLOT_FINISH_TIMES
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
-def test_plan(mocked_init):
+def test_plan(mocked_init, slot_finish_times, monkeypatch):
+    monkeypatch.setattr(heft_planner, "_find_slot_finish_times", slot_finish_times)
     # Create Workflow objects for the campaign
     dag = DAG()
     for i in range(8):
@@ -40,7 +51,6 @@ def test_plan(mocked_init):
     ]
     planner = HeftPlanner(None, None, None)
     planner._logger = MagicMock()
-    planner._estimated_memory = list()
 
     planner._resource_requirements = {
         1: {"req_cpus": 64, "req_memory": 2000, "req_walltime": 45},
@@ -114,7 +124,6 @@ def test_failing_plan(mocked_init):
 
     planner = HeftPlanner(None, None, None)
     planner._logger = MagicMock()
-    planner._estimated_memory = list()
 
     planner._resource_requirements = {
         1: {"req_cpus": 7168, "req_memory": 64000000, "req_walltime": 13200.000000000002},
@@ -150,8 +159,10 @@ def test_failing_plan(mocked_init):
 
 
 # New test cases for helper methods
+@SLOT_FINISH_TIMES
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
-def test_plan_with_dag_dependencies(mocked_init):
+def test_plan_with_dag_dependencies(mocked_init, slot_finish_times, monkeypatch):
+    monkeypatch.setattr(heft_planner, "_find_slot_finish_times", slot_finish_times)
     """Test that the planner schedules dependent workflows after their predecessors."""
     dag = DAG()
     for w in [
@@ -176,7 +187,6 @@ def test_plan_with_dag_dependencies(mocked_init):
 
     planner = HeftPlanner(None, None, None)
     planner._logger = MagicMock()
-    planner._estimated_memory = list
 
     planner._resource_requirements = {
         1: {"req_cpus": 224, "req_memory": 2000, "req_walltime": 45},
@@ -225,21 +235,22 @@ def test_initialize_resource_estimates(mocked_init):
 
     requirements = planner._initialize_resource_estimates(resource_requirements, widxs=[1,2])
 
-    assert requirements["estimated_walltime"] == [45, 25]
-    assert requirements["estimated_cpus"] == [64, 16]
-    assert requirements["estimated_memory"] == [2000, 15000]
+    assert list(requirements["estimated_walltime"]) == [45, 25]
+    assert list(requirements["estimated_cpus"]) == [64, 16]
+    assert list(requirements["estimated_memory"]) == [2000, 15000]
 
 
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
-def test_get_sorted_workflow_indices(mocked_init):
-    """Test that workflows are sorted by execution time (longest first)."""
+def test_build_ready_queue(mocked_init):
+    """Test that workflows are dequeued by execution time (longest first)."""
     planner = HeftPlanner(None, None, None)
-    planner._estimated_walltime = [45, 25, 560, 140, 145]
+    estimated_walltime = [45, 25, 560, 140, 145, 45]
 
-    sorted_indices = planner._get_sorted_workflow_indices(planner._estimated_walltime)
+    ready_queue = planner._build_ready_queue(estimated_walltime)
+    sorted_indices = [heapq.heappop(ready_queue)[1] for _ in range(len(ready_queue))]
 
-    # Should be sorted in descending order: 560, 145, 140, 45, 25
-    assert sorted_indices == [2, 4, 3, 0, 1]
+    # Should be sorted in descending order: 560, 145, 140, 45, 45, 25 (ties by index)
+    assert sorted_indices == [2, 4, 3, 0, 5, 1]
 
 
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
@@ -264,34 +275,48 @@ def test_initialize_resource_free_times(mocked_init):
     assert all(t == 0.0 for t in result)
 
 
-@mock.patch.object(HeftPlanner, "__init__", return_value=None)
-def test_get_free_memory(mocked_init):
+def test_free_memory():
     """Test memory availability calculation."""
-    planner = HeftPlanner(None, None, None)
-    planner._resources = Resource(
-        name="test",
-        nodes=2,
-        cores_per_node=10,
-        memory_per_node=1000,  # 2000 total
-    )
-
-    # Create a mock plan with PlanEntry
-    planner._plan = [
-        PlanEntry(workflow=Workflow(name="W1", executable="exe", context="ctx", subcommand="sub", id=1), cores=range(0, 5), memory=500, start_time=0, end_time=100),
-        PlanEntry(workflow=Workflow(name="W2", executable="exe", context="ctx", subcommand="sub", id=2), cores=range(5, 10), memory=300, start_time=50, end_time=150),
-    ]
+    # W1 holds 500 MB over [0, 100), W2 holds 300 MB over [50, 150); 2000 MB in total
+    plan_start = np.array([0.0, 50.0])
+    plan_end = np.array([100.0, 150.0])
+    plan_memory = np.array([500.0, 300.0])
 
     # At time 25: only W1 is running (500 used)
-    assert planner._get_free_memory(25, 2) == 1500
+    assert _free_memory(plan_start, plan_end, plan_memory, 2000.0, 25.0) == 1500
 
     # At time 75: both W1 and W2 are running (800 used)
-    assert planner._get_free_memory(75, 2) == 1200
+    assert _free_memory(plan_start, plan_end, plan_memory, 2000.0, 75.0) == 1200
 
     # At time 125: only W2 is running (300 used)
-    assert planner._get_free_memory(125, 2) == 1700
+    assert _free_memory(plan_start, plan_end, plan_memory, 2000.0, 125.0) == 1700
 
     # At time 200: nothing running
-    assert planner._get_free_memory(200, 2) == 2000
+    assert _free_memory(plan_start, plan_end, plan_memory, 2000.0, 200.0) == 2000
+
+
+@mock.patch.object(HeftPlanner, "__init__", return_value=None)
+def test_append_plan_entry_grows_plan_columns(mocked_init):
+    """Test that the plan columns mirror the plan and grow past their preallocated size."""
+    planner = HeftPlanner(None, None, None)
+    planner._reset_plan(size=1)
+
+    for i in range(3):
+        planner._append_plan_entry(
+            PlanEntry(
+                workflow=Workflow(name=f"W{i}", id=i),
+                cores=range(4 * i, 4 * i + 4),
+                memory=100 * i,
+                start_time=i,
+                end_time=i + 10,
+            )
+        )
+
+    rows = len(planner._plan)
+    assert rows == 3
+    assert list(planner._plan_start[:rows]) == [0, 1, 2]
+    assert list(planner._plan_end[:rows]) == [10, 11, 12]
+    assert list(planner._plan_memory[:rows]) == [0, 100, 200]
 
 
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
@@ -313,7 +338,7 @@ def test_find_best_resource_slot_respects_earlier_start(mocked_init):
     """
     planner = HeftPlanner(None, None, None)
     planner._logger = MagicMock()
-    planner._plan = []
+    planner._reset_plan()
     planner._resources = Resource(
         name="test",
         nodes=1,
@@ -344,6 +369,50 @@ def test_find_best_resource_slot_respects_earlier_start(mocked_init):
     assert np.isclose(start_time, 20.0), f"Expected start_time=20.0, got {start_time}"
 
 
+@SLOT_FINISH_TIMES
+def test_slot_finish_times_skips_slots_without_memory(slot_finish_times):
+    """Test that slots without enough free memory get an infinite finish time.
+
+    Cores 0-1 are free at t=0 but a running workflow holds 900 of the 1000 MB
+    until t=30, so the 200 MB workflow can only run on cores 2-3 at t=30.
+    """
+    resource_free = np.array([0.0, 0.0, 30.0, 30.0])
+    plan_start = np.array([0.0])
+    plan_end = np.array([30.0])
+    plan_memory = np.array([900.0])
+
+    finish_times = slot_finish_times(
+        resource_free, plan_start, plan_end, plan_memory, 1000.0, 10.0, 2, 200.0, 0.0
+    )
+    assert np.isinf(finish_times[0])
+    assert np.isclose(finish_times[1], 40.0)
+
+    # Slots that do not fit a whole block of cores are never considered
+    finish_times = slot_finish_times(
+        resource_free, plan_start, plan_end, plan_memory, 1000.0, 10.0, 3, 200.0, 0.0
+    )
+    assert len(finish_times) == 1
+
+
+def test_slot_finish_times_numpy_matches_kernel():
+    """Test that the NumPy fallback returns the kernel's finish times."""
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        # Integer-valued times so that several slots share a start time
+        resource_free = rng.integers(0, 50, size=24).astype(float)
+        plan_start = rng.integers(0, 50, size=10).astype(float)
+        plan_end = plan_start + rng.integers(1, 30, size=10)
+        plan_memory = rng.integers(0, 400, size=10).astype(float)
+        args = (plan_start, plan_end, plan_memory, 1000.0, 10.0)
+        cpus = int(rng.integers(1, 8))
+        memory = float(rng.integers(0, 600))
+        earlier_start = float(rng.integers(0, 40))
+
+        expected = _slot_finish_times(resource_free, *args, cpus, memory, earlier_start)
+        result = _slot_finish_times_numpy(resource_free, *args, cpus, memory, earlier_start)
+        np.testing.assert_array_equal(result, expected)
+
+
 @mock.patch.object(HeftPlanner, "__init__", return_value=None)
 def test_calculate_plan_dependency_not_violated_by_idle_cores(mocked_init):
     """Test that a dependent workflow is not scheduled before its predecessor finishes,
@@ -370,7 +439,6 @@ def test_calculate_plan_dependency_not_violated_by_idle_cores(mocked_init):
 
     planner = HeftPlanner(None, None, None)
     planner._logger = MagicMock()
-    planner._estimated_memory = []
     planner._resource_requirements = {
         1: {"req_cpus": 2, "req_memory": 100, "req_walltime": 20},
         2: {"req_cpus": 2, "req_memory": 100, "req_walltime": 10},
@@ -432,3 +500,26 @@ def test_find_suitable_qos_policies_basic(mocked_init):
     assert suitable == QosPolicy(name="long", max_walltime=240, max_jobs=10, max_cores=400)
     with pytest.raises(ValueError):
         planner._find_suitable_qos_policies(requested_cores=410)
+
+
+@mock.patch.object(HeftPlanner, "__init__", return_value=None)
+def test_get_plan_graph(mocked_init):
+    """Test that each workflow depends on the last workflows scheduled on its cores."""
+    planner = HeftPlanner(None, None, None)
+    planner._logger = MagicMock()
+
+    def entry(wid, cores):
+        return PlanEntry(workflow=Workflow(name=f"W{wid}", id=wid), cores=cores, memory=0, start_time=0, end_time=0)
+
+    plan = [
+        entry(1, range(0, 4)),
+        entry(2, range(4, 8)),
+        entry(3, range(0, 2)),
+        entry(4, range(0, 8)),
+        entry(5, range(8, 10)),
+    ]
+    graph = planner._get_plan_graph(plan, range(10))
+
+    assert set(graph.nodes) == {1, 2, 3, 4, 5}
+    # W4 runs on cores 0-7: cores 0-1 were last used by W3, 2-3 by W1 and 4-7 by W2
+    assert set(graph.edges) == {(1, 3), (1, 4), (2, 4), (3, 4)}
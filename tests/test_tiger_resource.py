@@ -1,5 +1,5 @@
 from socm.core.models import QosPolicy
-from socm.resources.tiger import TigerResource
+from socm.resources.tiger import TIGER_QOS_TEST, TIGER_QOS_VSHORT, TigerResource
 
 
 def test_tiger_resource_init():
@@ -60,6 +60,29 @@ def test_tiger_resource_custom_values():
     assert len(resource.qos) == 6
 
 
+def test_tiger_resource_shares_default_qos():
+    """Test that default QoS policies are built once and shared between instances."""
+    first = TigerResource()
+    second = TigerResource()
+
+    assert first.qos is not second.qos
+    assert all(a is b for a, b in zip(first.qos, second.qos))
+
+
+def test_tiger_default_qos_matches_validated_policy():
+    """Test that the unvalidated default constants equal their validated counterparts."""
+    assert TIGER_QOS_TEST == QosPolicy(name="test", max_walltime=60, max_jobs=1, max_cores=8000)
+    assert TIGER_QOS_VSHORT == QosPolicy(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104)
+
+
+def test_tiger_resource_custom_qos():
+    """Test that user-provided QoS policies are not overridden by the defaults."""
+    custom = [QosPolicy(name="custom", max_walltime=10, max_jobs=1, max_cores=10)]
+    resource = TigerResource(qos=custom)
+
+    assert resource.qos == custom
+
+
 def test_fits_in_qos_perfect_fit():
     """Test that a job fits perfectly in one QoS."""
     resource = TigerResource()
@@ -106,25 +129,25 @@ def test_fits_in_qos_cores_too_many():
 def test_fits_in_qos_with_existing_jobs():
     """Test that fits_in_qos accounts for cores used by existing jobs."""
     resource = TigerResource()
-    resource._existing_jobs = {"test": [("job1", 30, 7000)]}
+    resource._add_job("test", ("job1", 30, 7000))
 
     qos = resource.fits_in_qos(walltime=30, cores=500)
-    assert qos == QosPolicy(name='vshort', max_walltime=300, max_jobs=2000, max_cores=55104)
+    assert qos is TIGER_QOS_VSHORT
 
     # Now try with 1500 cores (7000 + 1500 > 8000)
     qos = resource.fits_in_qos(walltime=30, cores=1500)
-    assert qos == QosPolicy(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104)
+    assert qos is TIGER_QOS_VSHORT
 
 
 def test_fits_in_qos_no_remaining_cores():
     """Test when all cores in a QoS are consumed."""
     resource = TigerResource()
 
-    resource._existing_jobs = {"test": [("job1", 30, 8000)]}
+    resource._add_job("test", ("job1", 30, 8000))
 
     # Try to fit another job
     qos = resource.fits_in_qos(walltime=30, cores=100)
-    assert qos == QosPolicy(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104)
+    assert qos is TIGER_QOS_VSHORT
 
 
 def test_register_job_success():
@@ -212,7 +235,7 @@ def test_register_job_integration():
     # Check if job fits
     qos_before = resource.fits_in_qos(walltime=30, cores=8000)
     assert qos_before is not None
-    assert qos_before == QosPolicy(name="test", max_walltime=60, max_jobs=1, max_cores=8000)
+    assert qos_before is TIGER_QOS_TEST
 
     # Register the job
     result = resource.register_job("large_job", walltime=30, cores=8000)
@@ -222,4 +245,35 @@ def test_register_job_integration():
     qos_after = resource.fits_in_qos(walltime=30, cores=100)
     # Should skip test and return vshort
     assert qos_after is not None
-    assert qos_after == QosPolicy(name="vshort", max_walltime=300, max_jobs=2000, max_cores=55104)
+    assert qos_after is TIGER_QOS_VSHORT
+
+
+def test_register_jobs_first_fit_decreasing():
+    """Test that batch registration places the largest jobs first."""
+    resource = TigerResource()
+
+    # Registered one by one, "small" would take the single 'test' slot
+    result = resource.register_jobs([("small", 30, 100), ("big", 30, 8000), ("long", 200, 100)])
+
+    assert result == [True, True, True]
+    assert resource._existing_jobs["test"] == [("big", 30, 8000)]
+    assert resource._existing_jobs["vshort"] == [("long", 200, 100), ("small", 30, 100)]
+
+
+def test_register_jobs_partial_failure():
+    """Test that jobs which fit nowhere are reported and not registered."""
+    resource = TigerResource()
+
+    result = resource.register_jobs([("job1", 30, 1000), ("too_long", 30000, 10)])
+
+    assert result == [True, False]
+    assert resource._existing_jobs == {"test": [("job1", 30, 1000)]}
+
+
+def test_register_jobs_duplicate_ids():
+    """Test that jobs sharing an identifier each get their own result."""
+    resource = TigerResource()
+
+    result = resource.register_jobs([("job", 30, 100), ("job", 30000, 10), ("job", 200, 100)])
+
+    assert result == [True, False, True]
@@ -1,5 +1,5 @@
 from socm.core.models import QosPolicy
-from socm.resources.universe import UniverseResource
+from socm.resources.universe import UNIVERSE_QOS_MAIN, UniverseResource
 
 
 def test_universe_resource_init():
@@ -88,11 +88,11 @@ def test_fits_in_qos_with_existing_jobs():
     """Test that fits_in_qos accounts for cores used by existing jobs."""
     resource = UniverseResource()
     # Fill main QoS almost completely (max is 6272)
-    resource._existing_jobs = {"main": [("job1", 100, 6000)]}
+    resource._add_job("main", ("job1", 100, 6000))
 
     # Job should still fit in main since 6000 + 200 < 6272
     qos = resource.fits_in_qos(walltime=20, cores=200)
-    assert qos == QosPolicy(name='main', max_walltime=43200, max_jobs=5000, max_cores=6272)
+    assert qos is UNIVERSE_QOS_MAIN
 
     # Now try with 300 cores (6000 + 300 = 6300 > 6272, exceeds main limit)
     # Should return None since no other QoS exists
@@ -104,7 +104,7 @@ def test_fits_in_qos_no_remaining_cores():
     """Test when all cores in a QoS are consumed."""
     resource = UniverseResource()
 
-    resource._existing_jobs = {"main": [("job1", 20, 6272)]}
+    resource._add_job("main", ("job1", 20, 6272))
 
     # Try to fit another job - should fail since main is full
     qos = resource.fits_in_qos(walltime=20, cores=100)
@@ -176,7 +176,7 @@ def test_register_job_integration():
     # Check if job fits
     qos_before = resource.fits_in_qos(walltime=20, cores=1024)
     assert qos_before is not None
-    assert qos_before == QosPolicy(name="main", max_walltime=43200, max_jobs=5000, max_cores=6272)
+    assert qos_before is UNIVERSE_QOS_MAIN
 
     # Register the job
     result = resource.register_job("large_job", walltime=20, cores=1024)
@@ -185,4 +185,14 @@ def test_register_job_integration():
     # Verify job was registered in main QoS
     qos_after = resource.fits_in_qos(walltime=20, cores=100)
     assert qos_after is not None
-    assert qos_after == QosPolicy(name="main", max_walltime=43200, max_jobs=5000, max_cores=6272)
+    assert qos_after is UNIVERSE_QOS_MAIN
+
+
+def test_register_jobs_fills_qos():
+    """Test batch registration against the single 'main' QoS."""
+    resource = UniverseResource()
+
+    result = resource.register_jobs([("job1", 20, 3000), ("job2", 100, 3272), ("job3", 20, 100)])
+
+    assert result == [True, True, False]
+    assert resource._existing_jobs["main"] == [("job2", 100, 3272), ("job1", 20, 3000)]
@@ -0,0 +1,19 @@
+"""Tests for socm.utils.states module."""
+
+from socm.utils.states import CFINAL, States
+
+
+def test_state_constants_are_unique():
+    """Test that all state constants have unique values."""
+    states = [States.NEW, States.PLANNING, States.EXECUTING, States.DONE, States.FAILED, States.CANCELED]
+    assert len(states) == len(set(states))
+
+
+def test_cfinal_contains_final_states():
+    """Test that CFINAL contains exactly the final states."""
+    assert CFINAL == frozenset({States.DONE, States.FAILED, States.CANCELED})
+
+
+def test_cfinal_does_not_contain_active_states():
+    """Test that CFINAL does not contain active states."""
+    assert CFINAL.isdisjoint({States.NEW, States.PLANNING, States.EXECUTING})
@@ -1,103 +1,154 @@
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, ClassVar, Dict, Tuple
 from unittest import mock
 
 import pytest
 
+from socm.workflows import PWVNullTestWorkflow
+from socm.workflows.ml_null_tests import NullTestWorkflow
+
+# Read-only metadata shared by every get_meta call
+_META = SimpleNamespace(samps=SimpleNamespace(count=1000))
+
+_ACT_OBSERVATIONS = (
+    (
+        "1551468569.1551475843.ar5_1",
+        {
+            "obs_id": "1551468569.1551475843.ar5_1",
+            "n_samples": 259584,
+            "timestamp": 1575600533,
+            "wafer_slots_list": "ws0,ws1",
+            "tube_slot": "st1",
+            "az_center": 280,
+            "el_center": 35,
+            "pwv": 2.5,
+        },
+    ),
+)
+
+_LAT_OBSERVATIONS = (
+    (
+        "1551468569.1551475843.ar5_1",
+        {
+            "obs_id": "1551468569.1551475843.ar5_1",
+            "n_samples": 259584,
+            "timestamp": 1575600533,
+            "wafer_slots_list": "ws0,ws1",
+            "tube_slot": "st1",
+            "az_center": 280,
+            "pwv": 2.1,
+            "el_center": 35,
+        },
+    ),
+    (
+        "1551242564.1551254228.ar5_1",
+        {
+            "obs_id": "1551240592.1551250138.ar5_1",
+            "timestamp": 1551240591.0,
+            "pwv": 1.8157540559768677,
+            "wafer_slots_list": "ws0",
+            "tube_slot": "st1",
+            "az_center": 43.18838342795353,
+            "n_samples": 259584,
+            "el_center": 55,
+        },
+    ),
+)
+
+
+class _MockContext:
+    """Stand-in for sotodlib's Context answering obsdb queries from a fixed table."""
+
+    # (substring of the query, observation returned when it matches)
+    observations: ClassVar[Tuple[Tuple[str, Dict[str, Any]], ...]] = ()
+
+    def __init__(self, context_file):
+        self.obsdb = mock.Mock()
+        self.obsdb.query = mock.Mock(side_effect=self._query)
+
+    def _query(self, query):
+        return [observation for needle, observation in self.observations if needle in query]
+
+    def get_meta(self, obs_id):
+        return _META
+
+
+class _MockContextAct(_MockContext):
+    observations = _ACT_OBSERVATIONS
+
+
+class _MockContextLat(_MockContext):
+    observations = _LAT_OBSERVATIONS
+
+
+@pytest.fixture(scope="module")
+def null_test_output_dir(tmp_path_factory):
+    """
+    Run a null-test module from its own temporary directory.
+
+    get_workflows writes per-split query files under output/ relative to the
+    working directory and reads them back, so every fixture that lets a test
+    build null-test workflows requests this one. Module scope keeps the
+    directory in place for the module-scoped workflow fixtures.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path_factory.mktemp("null_test_output"))
+        yield
+
 
 @pytest.fixture
-def mock_context_act():
+def mock_context_act(null_test_output_dir):
     """Create a fixture that returns a mock Context class."""
-    with mock.patch("socm.workflows.ml_null_tests.base.Context") as mocked:
-        # Create the mock context behavior
-        class MockContextImpl:
-            def __init__(self, context_file):
-                self.obsdb = mock.Mock()
-
-                def mock_query(query):
-                    if "1551468569.1551475843.ar5_1" in query:
-                        return [
-                            {
-                                "obs_id": "1551468569.1551475843.ar5_1",
-                                "n_samples": 259584,
-                                "timestamp": 1575600533,
-                                "wafer_slots_list": "ws0,ws1",
-                                "tube_slot": "st1",
-                                "az_center": 280,
-                                "el_center": 35,
-                                "pwv": 2.5,
-                            }
-                        ]
-                    return []
-
-                self.obsdb.query = mock.Mock(side_effect=mock_query)
-
-            def get_meta(self, obs_id):
-                return mock.Mock(samps=mock.Mock(count=1000))
-
-        # Set the side effect to use our implementation
-        mocked.side_effect = MockContextImpl
+    # Patch with the class itself; no test inspects calls, so no MagicMock is needed
+    with mock.patch("socm.workflows.ml_null_tests.base.Context", _MockContextAct) as mocked:
         yield mocked
 
 
+@pytest.fixture(scope="session")
+def workflow_file_dir(tmp_path_factory):
+    """Directory shared by the whole session for files referenced through file:// URLs."""
+    return tmp_path_factory.mktemp("workflow_files")
+
+
+@pytest.fixture(scope="session")
+def null_test_workflow(simple_config):
+    """
+    Build the mission-tests NullTestWorkflow once against the act mock context.
+
+    Shared by the whole session; tests must only read from it.
+    """
+    with mock.patch("socm.workflows.ml_null_tests.base.Context", _MockContextAct):
+        return NullTestWorkflow(**simple_config["campaign"]["ml-null-tests.mission-tests"])
+
+
+@pytest.fixture(scope="module")
+def pwv_workflows(simple_config, null_test_output_dir):
+    """
+    Split the mission-tests config into PWV null-test workflows once per module.
+
+    Tests must only read from the returned workflows.
+    """
+    with mock.patch("socm.workflows.ml_null_tests.base.Context", _MockContextAct):
+        return PWVNullTestWorkflow.get_workflows(simple_config["campaign"]["ml-null-tests.mission-tests"])
+
+
 @pytest.fixture
-def mock_context_lat():
+def mock_context_lat(null_test_output_dir):
     """Create a fixture that returns a mock Context class."""
-    with mock.patch("socm.workflows.ml_null_tests.base.Context") as mocked:
-        # Create the mock context behavior
-        class MockContextImpl:
-            def __init__(self, context_file):
-                self.obsdb = mock.Mock()
-
-                def mock_query(query):
-                    result = []
-                    if "1551468569.1551475843.ar5_1" in query:
-                        result.append(
-                            {
-                                "obs_id": "1551468569.1551475843.ar5_1",
-                                "n_samples": 259584,
-                                "timestamp": 1575600533,
-                                "wafer_slots_list": "ws0,ws1",
-                                "tube_slot": "st1",
-                                "az_center": 280,
-                                "pwv": 2.1,
-                                "el_center": 35,
-                            }
-                        )
-                    if "1551242564.1551254228.ar5_1" in query:
-                        result.append(
-                            {
-                                "obs_id": "1551240592.1551250138.ar5_1",
-                                "timestamp": 1551240591.0,
-                                "pwv": 1.8157540559768677,
-                                "wafer_slots_list": "ws0",
-                                "tube_slot": "st1",
-                                "az_center": 43.18838342795353,
-                                "n_samples": 259584,
-                                "el_center": 55,
-                            }
-                        )
-
-                    return result
-
-                self.obsdb.query = mock.Mock(side_effect=mock_query)
-
-            def get_meta(self, obs_id):
-                return mock.Mock(samps=mock.Mock(count=1000))
-
-        # Set the side effect to use our implementation
-        mocked.side_effect = MockContextImpl
+    # Patch with the class itself; no test inspects calls, so no MagicMock is needed
+    with mock.patch("socm.workflows.ml_null_tests.base.Context", _MockContextLat) as mocked:
         yield mocked
 
-@pytest.fixture
-def minimal_config():
-    return {
+
+_MINIMAL_CONFIG = MappingProxyType(
+    {
         "subcommand": "script.py",
         "resources": {"ranks": 4, "threads": 2},
     }
+)
 
-
-@pytest.fixture
-def full_config():
-    return {
+_FULL_CONFIG = MappingProxyType(
+    {
         "subcommand": "script.py",
         "resources": {"ranks": 4, "threads": 2},
         "script_args": ["file:///some/path/input.fits"],
@@ -105,3 +156,15 @@ def full_config():
         "config": "config.yaml",
         "output": "output_dir",
     }
+)
+
+
+@pytest.fixture
+def minimal_config():
+    # Tests only set top-level keys, so a shallow copy of the template suffices
+    return dict(_MINIMAL_CONFIG)
+
+
+@pytest.fixture
+def full_config():
+    return dict(_FULL_CONFIG)
@@ -1,8 +1,15 @@
+import re
+from datetime import timedelta
 from pathlib import Path
 
+import pytest
+
 from socm.workflows import DirectionNullTestWorkflow
 from socm.workflows.ml_null_tests import NullTestWorkflow
 
+_ERR_NEITHER = re.compile(r"Either chunk_nobs or duration must be set")
+_ERR_BOTH = re.compile(r"Only one of chunk_nobs or duration can be set")
+
 
 def test_direction_null_test_workflow(mock_context_act, simple_config):
     workflow = DirectionNullTestWorkflow(
@@ -29,7 +36,6 @@ def test_direction_null_test_workflow(mock_context_act, simple_config):
         simple_config["campaign"]["ml-null-tests.mission-tests"]
     )
     assert len(workflows) == 1
-    print(workflows)
     for idx, workflow in enumerate(workflows):
         assert isinstance(workflow, NullTestWorkflow)
         assert (
@@ -69,3 +75,22 @@ def test_get_arguments(mock_context_act, simple_config):
             "--tiled=1",
             "--wafer=ws0",
         ]
+
+
+def test_direction_null_test_scan_direction_detection(mock_context_act, simple_config):
+    workflow = DirectionNullTestWorkflow(
+        **simple_config["campaign"]["ml-null-tests.mission-tests"]
+    )
+    for az_center, direction in ((90, "rising"), (270, "setting"), (180, "middle")):
+        splits = workflow._get_splits(None, {"obs": {"az_center": az_center, "start_time": 0}})
+        assert list(splits) == [direction]
+
+
+def test_direction_null_test_error_handling(mock_context_act, simple_config):
+    config = simple_config["campaign"]["ml-null-tests.mission-tests"]
+
+    with pytest.raises(ValueError, match=_ERR_NEITHER):
+        DirectionNullTestWorkflow(**{**config, "chunk_nobs": None})
+
+    with pytest.raises(ValueError, match=_ERR_BOTH):
+        DirectionNullTestWorkflow(**{**config, "chunk_duration": timedelta(hours=1)})
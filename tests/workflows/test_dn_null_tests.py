@@ -5,12 +5,11 @@ from socm.workflows.ml_null_tests import NullTestWorkflow
 
 
 def test_day_night_null_test_workflow(mock_context_act, simple_config):
-    simple_config["campaign"]["ml-null-tests.mission-tests"][
-        "query"
-    ] = "obs_id IN ('1551468569.1551475843.ar5_1','1551242564.1551254228.ar5_1')"
-    workflow = DayNightNullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
+    config = {
+        **simple_config["campaign"]["ml-null-tests.mission-tests"],
+        "query": "obs_id IN ('1551468569.1551475843.ar5_1','1551242564.1551254228.ar5_1')",
+    }
+    workflow = DayNightNullTestWorkflow(**config)
     assert workflow.context == "context.yaml"
     assert workflow.area == "so_geometry_v20250306_lat_f090.fits"
     assert workflow.output_dir == "output/null_tests"
@@ -32,11 +31,8 @@ def test_day_night_null_test_workflow(mock_context_act, simple_config):
     assert workflow.subcommand == "make-ml-map"
     assert workflow.id is None  # Default value for id is None
 
-    workflows = DayNightNullTestWorkflow.get_workflows(
-        simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
+    workflows = DayNightNullTestWorkflow.get_workflows(config)
     assert len(workflows) == 1
-    print(workflows)
     for idx, workflow in enumerate(workflows):
         assert isinstance(workflow, NullTestWorkflow)
         assert workflow.output_dir == f"output/null_tests/night_split_{idx + 1}"
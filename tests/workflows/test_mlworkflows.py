@@ -1,11 +1,31 @@
 from pathlib import Path
 
 import hypothesis
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
 from socm.workflows import MLMapmakingWorkflow, SATSimWorkflow
 
+_QUERY = "obs_id='1575600533.1575611468.ar5_1'"
+_AREA = "so_geometry_v20250306_lat_f090.fits"
+_PREPROCESS = "preprocess.yaml"
+
+# Options following the positional arguments of get_arguments
+_EXPECTED_OPTIONS = (
+    "--bands=f090",
+    "--comps=TQU",
+    "--context=context.yaml",
+    "--maxiter=10",
+    "--site=act",
+    "--tiled=1",
+    "--wafer=ws0",
+)
+
+_ML_COMMAND_PREFIX = (
+    "srun --cpu_bind=cores --export=ALL --ntasks-per-node=8 --cpus-per-task=1 so-site-pipeline make-ml-map"
+)
+
 
 def test_mlworkflow(mock_context, simple_config):
     workflow = MLMapmakingWorkflow(**simple_config["campaign"]["ml-mapmaking"])
@@ -30,26 +50,20 @@ def test_mlworkflow(mock_context, simple_config):
 def test_get_arguments(mock_context, simple_config):
     workflow = MLMapmakingWorkflow(**simple_config["campaign"]["ml-mapmaking"])
     arguments = workflow.get_arguments()
-    assert arguments == [
-        "obs_id='1575600533.1575611468.ar5_1'",
-        str(Path("so_geometry_v20250306_lat_f090.fits").absolute()),
-        "output",
-        str(Path("preprocess.yaml").absolute()),
-        "--bands=f090",
-        "--comps=TQU",
-        "--context=context.yaml",
-        "--maxiter=10",
-        "--site=act",
-        "--tiled=1",
-        "--wafer=ws0",
-    ]
+    # Workflows resolve file paths when built, so resolve against the same cwd
+    area_abs = str(Path(_AREA).absolute())
+    preprocess_abs = str(Path(_PREPROCESS).absolute())
+    assert arguments == [_QUERY, area_abs, "output", preprocess_abs, *_EXPECTED_OPTIONS]
 
 
 def test_get_command(mock_context, lite_config):
     workflow = MLMapmakingWorkflow(**lite_config["campaign"]["ml-mapmaking"])
     command = workflow.get_command()
-    expected = f"srun --cpu_bind=cores --export=ALL --ntasks-per-node=8 --cpus-per-task=1 so-site-pipeline make-ml-map obs_id='1575600533.1575611468.ar5_1' {Path('so_geometry_v20250306_lat_f090.fits').absolute()} output {Path('preprocess.yaml').absolute()} --context=context.yaml --site=act"
-    assert command == expected
+    area_abs = Path(_AREA).absolute()
+    preprocess_abs = Path(_PREPROCESS).absolute()
+    assert command == (
+        f"{_ML_COMMAND_PREFIX} {_QUERY} {area_abs} output {preprocess_abs} --context=context.yaml --site=act"
+    )
 
     workflow = SATSimWorkflow(**lite_config["campaign"]["sat-sims"])
     command = workflow.get_command()
@@ -57,18 +71,13 @@ def test_get_command(mock_context, lite_config):
     assert command == expected
 
 
-@given(
-    maxiter=st.one_of(st.integers(), st.lists(st.integers(), min_size=1)),
-    downsample=st.one_of(st.integers(), st.lists(st.integers(), min_size=1)),
-    tiled=st.integers(),
-    datasize=st.integers(),
-)
-@hypothesis.settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture])
-def test_get_fields(mock_context, maxiter, downsample, tiled, datasize):
+_INT32 = st.integers(min_value=-(2**31), max_value=2**31 - 1)
+
+
+def _check_fields(maxiter, downsample, tiled, datasize):
     """
-    Test the get_numeric_fields method to ensure it correctly identifies numeric fields.
+    Check that get_numeric_fields and get_categorical_fields classify the workflow fields.
     """
-
     config = {
         "context": "context.yaml",
         "area": "area.fits",
@@ -80,14 +89,12 @@ def test_get_fields(mock_context, maxiter, downsample, tiled, datasize):
         "datasize": datasize,
     }
 
-    # breakpoint()
     workflow = MLMapmakingWorkflow(**config)
     numeric_fields = workflow.get_numeric_fields()
     assert "maxiter" in numeric_fields
     assert "downsample" in numeric_fields
     assert "tiled" in numeric_fields
 
-    workflow = MLMapmakingWorkflow(**config)
     numeric_fields = workflow.get_numeric_fields(avoid_attributes=["tiled"])
     assert "tiled" not in numeric_fields
 
@@ -104,3 +111,35 @@ def test_get_fields(mock_context, maxiter, downsample, tiled, datasize):
     assert "context" not in categorical_fields
     assert "maxiter" not in categorical_fields
     assert "downsample" not in categorical_fields
+
+
+@pytest.mark.parametrize(
+    "maxiter,downsample,tiled,datasize",
+    [
+        pytest.param(10, 5, 1, 100, id="scalars"),
+        pytest.param(-1, [1, 2], 0, 0, id="lists"),
+    ],
+)
+def test_get_fields(mock_context, maxiter, downsample, tiled, datasize):
+    """
+    Test the get_numeric_fields method to ensure it correctly identifies numeric fields.
+    """
+    _check_fields(maxiter, downsample, tiled, datasize)
+
+
+@given(
+    maxiter=st.one_of(_INT32, st.lists(st.integers(min_value=0, max_value=1000), min_size=1, max_size=8)),
+    downsample=st.one_of(_INT32, st.lists(st.integers(min_value=0, max_value=1000), min_size=1, max_size=8)),
+    tiled=_INT32,
+    datasize=_INT32,
+)
+@hypothesis.settings(
+    max_examples=10,
+    deadline=None,
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+)
+def test_get_fields_fuzz(mock_context, maxiter, downsample, tiled, datasize):
+    """
+    Fuzz the field classification over boundary integers and short integer lists.
+    """
+    _check_fields(maxiter, downsample, tiled, datasize)
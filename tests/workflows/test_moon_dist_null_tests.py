@@ -29,7 +29,6 @@ def test_moon_close_far_null_test_workflow(mock_context_act, simple_config):
         simple_config["campaign"]["ml-null-tests.mission-tests"]
     )
     assert len(workflows) == 1
-    print(workflows)
     for idx, workflow in enumerate(workflows):
         assert isinstance(workflow, NullTestWorkflow)
         assert workflow.output_dir == f"output/null_tests/moon_far_split_{idx + 1}"
@@ -1,66 +1,76 @@
-from socm.workflows.ml_null_tests import NullTestWorkflow
+import pytest
 
+from socm.workflows.ml_null_tests import NullTestWorkflow
 
-def test_null_test_workflow_initialization(mock_context_act, simple_config):
+pytestmark = pytest.mark.usefixtures("mock_context_act")
+
+EXPECTED_ATTRIBUTES = {
+    "context": "context.yaml",
+    "area": "so_geometry_v20250306_lat_f090.fits",
+    "output_dir": "output/null_tests",
+    "bands": "f090",
+    "wafer": "ws0",
+    "comps": "TQU",
+    "maxiter": 10,
+    "query": "obs_id IN ('1551468569.1551475843.ar5_1')",
+    "tiled": 1,
+    "site": "act",
+    "executable": "so-site-pipeline",
+    "subcommand": "make-ml-map",
+    "id": None,
+    "name": "lat_null_test_workflow",
+    "chunk_nobs": 5,
+    "chunk_duration": None,
+    "datasize": 259584,
+}
+
+INTERNAL_ARGUMENTS = frozenset(
+    {
+        "--executable",
+        "--subcommand",
+        "--id",
+        "--environment",
+        "--resources",
+        "--datasize",
+        "--chunk_nobs",
+        "--nsplits",
+        "--name",
+        "--chunk_duration",
+    }
+)
+
+EXPECTED_ENVIRONMENT = {"DOT_MOBY2": "act_dot_moby2", "SOTODLIB_SITECONFIG": "site.yaml"}
+
+
+def test_null_test_workflow_initialization(null_test_workflow):
     """Test basic initialization of NullTestWorkflow."""
-    workflow = NullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
-    assert workflow.context == "context.yaml"
-    assert workflow.area == "so_geometry_v20250306_lat_f090.fits"
-    assert workflow.output_dir == "output/null_tests"
-    assert workflow.bands == "f090"
-    assert workflow.wafer == "ws0"
-    assert workflow.comps == "TQU"
-    assert workflow.maxiter == 10
-    assert workflow.query == "obs_id IN ('1551468569.1551475843.ar5_1')"
-    assert workflow.tiled == 1
-    assert workflow.site == "act"
-    assert workflow.environment["DOT_MOBY2"] == "act_dot_moby2"
-    assert workflow.environment["SOTODLIB_SITECONFIG"] == "site.yaml"
-    assert workflow.name == "lat_null_test_workflow"
-    assert workflow.executable == "so-site-pipeline"
-    assert workflow.subcommand == "make-ml-map"
-    assert workflow.id is None
-    assert workflow.chunk_nobs == 5
-    assert workflow.chunk_duration is None
-    assert workflow.datasize == 259584
-
-
-def test_null_test_workflow_get_num_chunks_normal(mock_context_act, simple_config):
-    """Test _get_num_chunks with normal observation counts."""
-    workflow = NullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
-
-    # Test with various observation counts
-    assert workflow._get_num_chunks(5) == 1  # Exactly chunk_nobs
-    assert workflow._get_num_chunks(10) == 2  # 2 * chunk_nobs
-    assert workflow._get_num_chunks(7) == 2  # Ceiling division: (7+5-1)//5 = 2
-    assert workflow._get_num_chunks(11) == 3  # Ceiling division: (11+5-1)//5 = 3
-    assert workflow._get_num_chunks(1) == 1  # Less than chunk_nobs
-
-
-def test_null_test_workflow_get_num_chunks_zero(mock_context_act, simple_config):
-    """
-    Test _get_num_chunks when num_obs is 0.
-
-    This is a critical edge case that occurs when a split category has no
-    observations (e.g., all observations are 'high' PWV, leaving 'low' empty).
-    """
-    workflow = NullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
-
-    # When num_obs is 0, num_chunks should be 0
-    assert workflow._get_num_chunks(0) == 0
-
-
-def test_null_test_workflow_get_arguments(mock_context_act, simple_config):
+    workflow = null_test_workflow
+    actual = {key: getattr(workflow, key) for key in EXPECTED_ATTRIBUTES}
+    assert actual == EXPECTED_ATTRIBUTES
+    assert workflow.environment == EXPECTED_ENVIRONMENT
+
+
+@pytest.mark.parametrize(
+    "num_obs,expected",
+    [
+        pytest.param(5, 1, id="exactly_chunk_nobs"),
+        pytest.param(10, 2, id="twice_chunk_nobs"),
+        pytest.param(7, 2, id="ceil_7"),  # (7+5-1)//5 = 2
+        pytest.param(11, 3, id="ceil_11"),  # (11+5-1)//5 = 3
+        pytest.param(1, 1, id="less_than_chunk_nobs"),
+        # A split category with no observations (e.g. all observations are
+        # 'high' PWV, leaving 'low' empty) must yield no chunks
+        pytest.param(0, 0, id="zero"),
+    ],
+)
+def test_null_test_workflow_get_num_chunks(null_test_workflow, num_obs, expected):
+    """Test _get_num_chunks ceiling division, including the empty case."""
+    assert null_test_workflow._get_num_chunks(num_obs) == expected
+
+
+def test_null_test_workflow_get_arguments(null_test_workflow):
     """Test get_arguments method returns properly formatted argument list."""
-    workflow = NullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
+    workflow = null_test_workflow
 
     arguments = workflow.get_arguments()
 
@@ -81,39 +91,29 @@ def test_null_test_workflow_get_arguments(mock_context_act, simple_config):
     assert "--wafer=ws0" in arguments
 
 
-def test_null_test_workflow_get_arguments_excludes_internal_fields(
-    mock_context_act, simple_config
-):
+def test_null_test_workflow_get_arguments_excludes_internal_fields(null_test_workflow):
     """Test that get_arguments excludes internal workflow fields."""
-    workflow = NullTestWorkflow(
-        **simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
+    workflow = null_test_workflow
 
     arguments = workflow.get_arguments()
-    arg_string = " ".join(arguments)
+    # Take the name of every token so bare flags count as well as --key=value
+    arg_prefixes = {argument.split("=", 1)[0] for argument in arguments}
 
     # These fields should not appear in arguments
-    assert "--executable=" not in arg_string
-    assert "--subcommand=" not in arg_string
-    assert "--id=" not in arg_string
-    assert "--environment=" not in arg_string
-    assert "--resources=" not in arg_string
-    assert "--datasize=" not in arg_string
-    assert "--chunk_nobs=" not in arg_string
-    assert "--nsplits=" not in arg_string
-    assert "--name=" not in arg_string
-    assert "--chunk_duration=" not in arg_string
-
-
-def test_null_test_workflow_with_file_query(mock_context_act, simple_config, tmp_path):
-    """Test workflow initialization with file:// query."""
-    config = simple_config["campaign"]["ml-null-tests.mission-tests"].copy()
+    assert INTERNAL_ARGUMENTS.isdisjoint(arg_prefixes)
 
-    # Create a query file
-    query_file = tmp_path / "test_query.txt"
-    query_file.write_text("obs_id IN ('1551468569.1551475843.ar5_1')\n")
 
-    config["query"] = f"file://{query_file}"
+@pytest.fixture(scope="module")
+def query_file(workflow_file_dir):
+    """Write the obs-id query file once; NullTestWorkflow reads it back on construction."""
+    path = workflow_file_dir / "test_query.txt"
+    path.write_text("1551468569.1551475843.ar5_1\n")
+    return path
+
+
+def test_null_test_workflow_with_file_query(simple_config, query_file):
+    """Test workflow initialization with file:// query."""
+    config = {**simple_config["campaign"]["ml-null-tests.mission-tests"], "query": f"file://{query_file}"}
 
     workflow = NullTestWorkflow(**config)
 
@@ -121,15 +121,13 @@ def test_null_test_workflow_with_file_query(mock_context_act, simple_config, tmp
     assert workflow.datasize == 259584
 
 
-def test_null_test_workflow_file_url_handling(mock_context_act, simple_config, tmp_path):
+def test_null_test_workflow_file_url_handling(simple_config, workflow_file_dir, request):
     """Test that file:// URLs are properly converted to absolute paths in arguments."""
-    config = simple_config["campaign"]["ml-null-tests.mission-tests"].copy()
-
-    # Create a test file
-    test_file = tmp_path / "test_file.fits"
+    # Create a test file, named after the test to avoid collisions in the shared directory
+    test_file = workflow_file_dir / f"{request.node.name}.fits"
     test_file.write_text("test")
 
-    config["area"] = f"file://{test_file}"
+    config = {**simple_config["campaign"]["ml-null-tests.mission-tests"], "area": f"file://{test_file}"}
 
     workflow = NullTestWorkflow(**config)
     arguments = workflow.get_arguments()
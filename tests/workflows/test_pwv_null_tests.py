@@ -1,36 +1,52 @@
 from pathlib import Path
 
+import pytest
+
 from socm.workflows import PWVNullTestWorkflow
 from socm.workflows.ml_null_tests import NullTestWorkflow
 
+pytestmark = pytest.mark.usefixtures("mock_context_act")
+
+EXPECTED_ATTRIBUTES = {
+    "context": "context.yaml",
+    "area": "so_geometry_v20250306_lat_f090.fits",
+    "output_dir": "output/null_tests",
+    "bands": "f090",
+    "wafer": "ws0",
+    "comps": "TQU",
+    "maxiter": 10,
+    "query": "obs_id IN ('1551468569.1551475843.ar5_1')",
+    "tiled": 1,
+    "site": "act",
+    "executable": "so-site-pipeline",
+    "subcommand": "make-ml-map",
+    "id": None,
+    "name": "pwv_null_test_workflow",
+}
+
+EXPECTED_ENVIRONMENT = {"DOT_MOBY2": "act_dot_moby2", "SOTODLIB_SITECONFIG": "site.yaml"}
+
+OPTIONAL_ARGS = (
+    "--bands=f090",
+    "--comps=TQU",
+    "--context=context.yaml",
+    "--maxiter=10",
+    "--site=act",
+    "--tiled=1",
+    "--wafer=ws0",
+)
 
-def test_pwv_null_test_workflow(mock_context_act, simple_config):
+
+def test_pwv_null_test_workflow(simple_config, pwv_workflows):
     workflow = PWVNullTestWorkflow(
         **simple_config["campaign"]["ml-null-tests.mission-tests"]
     )
-    assert workflow.context == "context.yaml"
-    assert workflow.area == "so_geometry_v20250306_lat_f090.fits"
-    assert workflow.output_dir == "output/null_tests"
-    assert workflow.bands == "f090"
-    assert workflow.wafer == "ws0"
-    assert workflow.comps == "TQU"
-    assert workflow.maxiter == 10
-    assert workflow.query == "obs_id IN ('1551468569.1551475843.ar5_1')"
-    assert workflow.tiled == 1
-    assert workflow.site == "act"
-    assert workflow.environment["DOT_MOBY2"] == "act_dot_moby2"
-    assert workflow.environment["SOTODLIB_SITECONFIG"] == "site.yaml"
-    assert workflow.name == "pwv_null_test_workflow"
-    assert workflow.executable == "so-site-pipeline"
-    assert workflow.subcommand == "make-ml-map"
-    assert workflow.id is None  # Default value for id is None
-
-    workflows = PWVNullTestWorkflow.get_workflows(
-        simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
-    assert len(workflows) == 1
-    print(workflows)
-    for idx, workflow in enumerate(workflows):
+    actual = {key: getattr(workflow, key) for key in EXPECTED_ATTRIBUTES}
+    assert actual == EXPECTED_ATTRIBUTES
+    assert workflow.environment == EXPECTED_ENVIRONMENT
+
+    assert len(pwv_workflows) == 1
+    for idx, workflow in enumerate(pwv_workflows):
         assert isinstance(workflow, NullTestWorkflow)
         assert workflow.output_dir == f"output/null_tests/pwv_high_split_{idx + 1}"
         assert (
@@ -43,36 +59,28 @@ def test_pwv_null_test_workflow(mock_context_act, simple_config):
             assert workflow.datasize == 0
 
 
-def test_get_arguments(mock_context_act, simple_config):
-    workflows = PWVNullTestWorkflow.get_workflows(
-        simple_config["campaign"]["ml-null-tests.mission-tests"]
-    )
+def test_get_arguments(pwv_workflows):
+    # Resolve the invariant paths once instead of on every iteration
+    area_abs = str(Path("so_geometry_v20250306_lat_f090.fits").absolute())
+    preprocess_abs = str(Path("preprocess.yaml").absolute())
+    base = Path("output/null_tests").absolute()
 
-    for idx, workflow in enumerate(workflows):
+    for idx, workflow in enumerate(pwv_workflows):
         assert workflow.get_arguments() == [
-            str(
-                Path(f"output/null_tests/pwv_high_split_{idx + 1}/query.txt").absolute()
-            ),
-            str(Path("so_geometry_v20250306_lat_f090.fits").absolute()),
+            str(base / f"pwv_high_split_{idx + 1}" / "query.txt"),
+            area_abs,
             f"output/null_tests/pwv_high_split_{idx + 1}",
-            str(Path("preprocess.yaml").absolute()),
-            "--bands=f090",
-            "--comps=TQU",
-            "--context=context.yaml",
-            "--maxiter=10",
-            "--site=act",
-            "--tiled=1",
-            "--wafer=ws0",
+            preprocess_abs,
+            *OPTIONAL_ARGS,
         ]
 
-def test_pwv_null_test_empty_pwv_group(mock_context_act, simple_config, monkeypatch):
+def test_pwv_null_test_empty_pwv_group(simple_config, monkeypatch):
     """
     Test that _get_splits handles num_chunks=0 correctly when a PWV group is empty.
     This directly tests the conditional on line 72:
     `obs_lists = np.array_split(sorted_ids, num_chunks) if num_chunks > 0 else []`
     """
-    config = simple_config["campaign"]["ml-null-tests.mission-tests"].copy()
-    workflow = PWVNullTestWorkflow(**config)
+    workflow = PWVNullTestWorkflow(**simple_config["campaign"]["ml-null-tests.mission-tests"])
 
     # Create a scenario with empty low PWV observations
     ctx = None  # Mock context not needed for this unit test
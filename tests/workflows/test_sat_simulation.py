@@ -0,0 +1,70 @@
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from socm.workflows import SATSimWorkflow
+
+_EXPECTED_TRANSLATIONS = MappingProxyType(
+    {
+        "sim_hwpss_atmo_data": "sim_hwpss.atmo_data",
+        "pixels_healpix_radec_nside": "pixels_healpix_radec.nside",
+        "filterbin_name": "filterbin.name",
+        "processing_mask_file": "processing_mask.file",
+    }
+)
+
+# (id, field overrides, arguments expected in the output)
+GET_ARGUMENTS_CASES: Tuple[Tuple[str, Dict[str, Any], Tuple[str, ...]], ...] = (
+    (
+        "defaults",
+        {},
+        ("--bands=SAT_f090", "--sample_rate=37", "--wafer_slots=w25"),
+    ),
+    (
+        "boolean_handling",
+        {"sim_noise": True, "scan_map": False},
+        ("--sim_noise.enable", "--scan_map.disable"),
+    ),
+    (
+        "arg_translation",
+        {"filterbin_name": "filterbin_01", "pixels_healpix_radec_nside": 256},
+        ("--filterbin.name=filterbin_01", "--pixels_healpix_radec.nside=256"),
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "overrides,expected",
+    [pytest.param(*case[1:], id=case[0]) for case in GET_ARGUMENTS_CASES],
+)
+def test_sat_workflow_get_arguments(overrides, expected):
+    workflow = SATSimWorkflow(context="context.yaml", output_dir="output", **overrides)
+    tokens = workflow.get_arguments().split()
+    assert tokens[:2] == ["--out", "output"]
+    assert set(expected) <= set(tokens)
+
+
+def test_sat_workflow_get_arguments_file_url():
+    workflow = SATSimWorkflow(context="context.yaml", output_dir="output", schedule="file://schedule0002.txt")
+    # The workflow resolves the path against the current directory when called
+    assert f"--schedule={Path('schedule0002.txt').absolute()}" in workflow.get_arguments().split()
+
+
+def test_sat_workflow_private_attributes():
+    workflow = SATSimWorkflow(context="context.yaml", output_dir="output")
+    assert workflow._arg_translation == _EXPECTED_TRANSLATIONS
+    assert "_arg_translation" not in workflow.model_dump()
+
+
+def test_sat_workflow_get_arguments_sorted_output():
+    workflow = SATSimWorkflow(
+        context="context.yaml", output_dir="output", zebra_param=1, alpha_param=2, beta_param=3
+    )
+    arguments = workflow.get_arguments()
+    # Each search starts where the previous match was found
+    alpha = arguments.find("--alpha_param=")
+    beta = arguments.find("--beta_param=", alpha)
+    zebra = arguments.find("--zebra_param=", beta)
+    assert -1 < alpha < beta < zebra